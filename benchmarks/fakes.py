@@ -0,0 +1,195 @@
+"""Offline stand-ins for Home Assistant, bleak and smbclient.
+
+`install()` registers just enough of each package in sys.modules for the
+integration modules to import and run without a real HA instance, BLE
+adapter or SMB server. Nothing here is used by the integration itself.
+"""
+from __future__ import annotations
+import asyncio
+import json
+import math
+import os
+import sys
+import types
+from dataclasses import dataclass, field
+
+# ---------- Home Assistant ----------
+class FakeHass:
+    def __init__(self):
+        self.data: dict = {}
+        self.ble_devices: dict[str, "FakeBLEDevice"] = {}
+
+    async def async_add_executor_job(self, target, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+class FakeStore:
+    """In-memory Store; serializes on save so the JSON cost is still measured."""
+
+    def __init__(self, hass, version, key, *args, **kwargs):
+        self.hass = hass
+        self.key = key
+        self.saved: str | None = None
+        self.saves = 0
+
+    async def async_load(self):
+        return json.loads(self.saved) if self.saved else None
+
+    async def async_save(self, data):
+        self.saved = json.dumps(data)
+        self.saves += 1
+
+class FakeConfigEntry:
+    def __init__(self, data: dict | None = None, options: dict | None = None):
+        self.entry_id = "bench"
+        self.data = data or {}
+        self.options = options or {}
+
+class FakeView:
+    """Subset of HomeAssistantView: json() builds a response object."""
+
+    def json(self, result, status_code=200, headers=None):
+        return FakeResponse(status=status_code, body=json.dumps(result).encode(), headers=headers)
+
+class FakeResponse:
+    def __init__(self, *, status=200, body=b"", text=None, headers=None, content_type=None):
+        self.status = status
+        self.body = text.encode() if text is not None else body
+        self.headers = dict(headers or {})
+
+class FakeRequest:
+    def __init__(self, hass, query: dict | None = None, headers: dict | None = None, body: dict | None = None):
+        self.app = {"hass": hass}
+        self.query = query or {}
+        self.headers = headers or {}
+        self._body = body or {}
+
+    async def json(self):
+        return self._body
+
+# ---------- bleak ----------
+@dataclass
+class FakeBLEDevice:
+    address: str
+    name: str = "Skelly"
+
+@dataclass
+class FakeCharacteristic:
+    uuid: str
+    properties: list[str]
+
+@dataclass
+class FakeService:
+    uuid: str
+    characteristics: list[FakeCharacteristic] = field(default_factory=list)
+
+class FakeBleakClient:
+    """Pretend GATT client: each write costs `latency` per MTU-sized chunk."""
+
+    mtu = 23
+    latency = 0.0
+    connect_latency = 0.0
+    services: list[FakeService] = []
+
+    def __init__(self, device, **kwargs):
+        self.device = device
+        self.is_connected = False
+        self.bytes_written = 0
+        self.writes = 0
+
+    async def connect(self):
+        if self.connect_latency:
+            await asyncio.sleep(self.connect_latency)
+        self.is_connected = True
+
+    async def pair(self):
+        return True
+
+    async def disconnect(self):
+        self.is_connected = False
+
+    async def write_gatt_char(self, char, payload: bytes, response: bool = False):
+        chunks = max(1, math.ceil(len(payload) / (self.mtu - 3)))
+        if self.latency:
+            await asyncio.sleep(self.latency * chunks)
+        self.bytes_written += len(payload)
+        self.writes += 1
+
+def configure_bleak(mtu: int = 23, latency: float = 0.0, connect_latency: float = 0.0, services=None):
+    """Return a FakeBleakClient subclass with the given link characteristics."""
+    return type(
+        "ConfiguredBleakClient",
+        (FakeBleakClient,),
+        {"mtu": mtu, "latency": latency, "connect_latency": connect_latency, "services": services or []},
+    )
+
+async def fake_establish_connection(client_class, device, name, *args, **kwargs):
+    client = client_class(device)
+    await client.connect()
+    return client
+
+def fake_ble_device_from_address(hass, address, connectable=True):
+    return hass.ble_devices.get(address)
+
+# ---------- smbclient ----------
+class LocalSmb(types.ModuleType):
+    """smbclient look-alike that maps \\\\host\\share\\... onto a local directory."""
+
+    def __init__(self, root: str = "/"):
+        super().__init__("smbclient")
+        self.root = root
+        self.path = types.SimpleNamespace(isdir=lambda p: os.path.isdir(self._local(p)))
+
+    def _local(self, unc: str) -> str:
+        parts = unc.lstrip("\\").split("\\")[2:]  # drop host and share
+        return os.path.join(self.root, *[p for p in parts if p])
+
+    def register_session(self, *args, **kwargs):
+        pass
+
+    def delete_session(self, *args, **kwargs):
+        pass
+
+    def reset_connection_cache(self):
+        pass
+
+    def listdir(self, unc: str):
+        return os.listdir(self._local(unc))
+
+# ---------- install ----------
+def _module(name: str, **attrs) -> types.ModuleType:
+    mod = sys.modules.get(name) or types.ModuleType(name)
+    for k, v in attrs.items():
+        setattr(mod, k, v)
+    sys.modules[name] = mod
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(_module(parent), child, mod)
+    return mod
+
+def install(smb_root: str = "/") -> LocalSmb:
+    """Register the fakes in sys.modules; returns the smbclient stand-in."""
+    class Platform:
+        SENSOR = "sensor"
+        BUTTON = "button"
+
+    _module("homeassistant.core", HomeAssistant=FakeHass, ServiceCall=object, State=object)
+    _module("homeassistant.config_entries", ConfigEntry=FakeConfigEntry)
+    _module("homeassistant.const", Platform=Platform)
+    _module("homeassistant.helpers.storage", Store=FakeStore)
+    _module("homeassistant.components.http", HomeAssistantView=FakeView)
+    _module("homeassistant.components.frontend", async_register_built_in_panel=lambda *a, **k: None)
+    _module(
+        "homeassistant.components.bluetooth",
+        async_ble_device_from_address=fake_ble_device_from_address,
+        async_discovered_service_info=lambda hass: [],
+    )
+    _module("bleak", BleakClient=FakeBleakClient)
+    _module("bleak.backends.device", BLEDevice=FakeBLEDevice)
+    _module("bleak_retry_connector", establish_connection=fake_establish_connection)
+    try:
+        import aiohttp.web  # noqa: F401
+    except ImportError:
+        _module("aiohttp.web", Response=FakeResponse, Request=FakeRequest)
+    smb = LocalSmb(smb_root)
+    sys.modules["smbclient"] = smb
+    return smb
@@ -0,0 +1,196 @@
+"""Offline performance benchmarks for Skelly Queue's hot paths.
+
+    python -m benchmarks.run [--output results.json] [--only queue,smb]
+
+Runs against the fakes in benchmarks/fakes.py (no HA, BLE adapter or SMB
+server needed) and prints one JSON document with a result per case, so
+two runs can be diffed or compared by CI between releases.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import datetime as dt
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks import fakes  # noqa: E402
+
+QUEUE_SIZE = 10_000
+LISTING_SIZE = 5_000
+BLE_WRITES = 200
+
+def _summary(samples: list[float]) -> dict:
+    """Latency summary in milliseconds."""
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "n": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "p50_ms": round(ms[len(ms) // 2], 4),
+        "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 4),
+        "max_ms": round(ms[-1], 4),
+    }
+
+async def _timed(coro_fn, n: int) -> list[float]:
+    samples = []
+    for i in range(n):
+        t0 = time.perf_counter()
+        await coro_fn(i)
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+def _timed_sync(fn, n: int) -> list[float]:
+    samples = []
+    for i in range(n):
+        t0 = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+# ---------- cases ----------
+async def bench_queue(hass) -> dict:
+    from custom_components.skelly_queue.storage import QueueStore
+
+    store = QueueStore(hass)
+    t0 = time.perf_counter()
+    await store.add_many({"filename": f"clip_{i:05d}.mp3"} for i in range(QUEUE_SIZE))
+    add_many_s = time.perf_counter() - t0
+
+    add = await _timed(lambda i: store.add({"filename": f"extra_{i}.mp3"}), 100)
+    remove_head = await _timed(lambda i: store.remove_at(0), 100)
+    get_queue = _timed_sync(lambda i: store.get_queue(), 100)
+    since = store.version - 50
+    delta = _timed_sync(lambda i: store.changes_since(since), 100)
+    return {
+        "queue_size": len(store.data["queue"]),
+        "add_many_10k_ms": round(add_many_s * 1000, 3),
+        "add": _summary(add),
+        "remove_at_head": _summary(remove_head),
+        "get_queue": _summary(get_queue),
+        "changes_since_50": _summary(delta),
+        "saves": store.store.saves,
+    }
+
+async def bench_smb(hass, smb_root: str) -> dict:
+    from custom_components.skelly_queue.smb_browser import SmbBrowser
+
+    big = Path(smb_root, "big")
+    big.mkdir(exist_ok=True)
+    for i in range(LISTING_SIZE):
+        (big / f"clip_{i:05d}.mp3").touch()
+    for i in range(LISTING_SIZE // 50):
+        (big / f"dir_{i:03d}").mkdir(exist_ok=True)
+
+    smb = SmbBrowser(hass, fakes.FakeConfigEntry({"smb_host": "bench", "smb_share": "media"}))
+    samples = await _timed(lambda i: smb.listdir("/big"), 10)
+    return {"entries": len(smb.listing("/big")["items"]), "listdir": _summary(samples)}
+
+async def bench_ble(hass, mtu: int, latency: float) -> dict:
+    from custom_components.skelly_queue import skelly_ble
+    from custom_components.skelly_queue.skelly_ble import SkellyBle
+
+    address = "AA:BB:CC:DD:EE:FF"
+    hass.ble_devices[address] = fakes.FakeBLEDevice(address)
+    skelly_ble.BleakClient = fakes.configure_bleak(mtu=mtu, latency=latency, connect_latency=latency * 10)
+    ble = SkellyBle(hass, address, "play-char", "cmd-char", pair_on_connect=False)
+
+    t0 = time.perf_counter()
+    await ble.write_cmd(b"\x00")
+    connect_s = time.perf_counter() - t0
+
+    payload = bytes(range(256)) * 2
+    t0 = time.perf_counter()
+    cue = await _timed(lambda i: ble.write_play(payload), BLE_WRITES)
+    elapsed = time.perf_counter() - t0
+    return {
+        "mtu": mtu,
+        "link_latency_ms": latency * 1000,
+        "first_write_with_connect_ms": round(connect_s * 1000, 3),
+        "cue_to_write": _summary(cue),
+        "throughput_kib_s": round(len(payload) * BLE_WRITES / elapsed / 1024, 2),
+    }
+
+async def bench_api(hass) -> dict:
+    from custom_components.skelly_queue.const import DOMAIN
+    from custom_components.skelly_queue.http import DATA_KEY, SkellyHttpView
+    from custom_components.skelly_queue.smb_browser import SmbBrowser
+    from custom_components.skelly_queue.storage import QueueStore
+
+    store = QueueStore(hass)
+    await store.add_many({"filename": f"clip_{i:05d}.mp3"} for i in range(QUEUE_SIZE))
+    smb = SmbBrowser(hass, fakes.FakeConfigEntry({"smb_host": "bench", "smb_share": "media"}))
+    hass.data.setdefault(DOMAIN, {})[DATA_KEY] = {"store": store, "smb": smb}
+    view = SkellyHttpView()
+
+    def get(query, headers=None):
+        return lambda i: view.get(fakes.FakeRequest(hass, query, headers))
+
+    etag = f'"q{store.version}"'
+    full = await view.get(fakes.FakeRequest(hass, {"op": "queue"}))
+    return {
+        "queue_full_bytes": len(full.body),
+        "queue_full": _summary(await _timed(get({"op": "queue"}), 50)),
+        "queue_not_modified": _summary(await _timed(get({"op": "queue"}, {"If-None-Match": etag}), 50)),
+        "queue_since": _summary(await _timed(get({"op": "queue", "since": str(store.version - 10)}), 50)),
+        "browse": _summary(await _timed(get({"op": "browse", "path": "/big"}), 10)),
+    }
+
+# ---------- runner ----------
+CASES = ("queue", "smb", "ble", "api")
+
+async def run(only: set[str], mtu: int, latency: float) -> dict:
+    with tempfile.TemporaryDirectory(prefix="skelly-bench-") as smb_root:
+        fakes.install(smb_root)
+        results = {}
+        if "queue" in only:
+            results["queue"] = await bench_queue(fakes.FakeHass())
+        if "smb" in only or "api" in only:
+            smb = await bench_smb(fakes.FakeHass(), smb_root)
+            if "smb" in only:
+                results["smb"] = smb
+        if "ble" in only:
+            results["ble"] = await bench_ble(fakes.FakeHass(), mtu, latency)
+        if "api" in only:
+            results["api"] = await bench_api(fakes.FakeHass())
+    return {
+        "meta": {
+            "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--output", "-o", help="write JSON here instead of stdout")
+    ap.add_argument("--only", default=",".join(CASES), help=f"comma-separated subset of {','.join(CASES)}")
+    ap.add_argument("--mtu", type=int, default=23, help="fake BLE ATT MTU (default 23)")
+    ap.add_argument("--latency-ms", type=float, default=2.0, help="fake BLE latency per MTU chunk")
+    args = ap.parse_args(argv)
+
+    only = {c.strip() for c in args.only.split(",") if c.strip()}
+    unknown = only - set(CASES)
+    if unknown:
+        ap.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+
+    report = asyncio.run(run(only, args.mtu, args.latency_ms / 1000))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
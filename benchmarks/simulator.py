@@ -0,0 +1,132 @@
+"""In-process Skelly BLE simulator.
+
+`SimulatedSkelly` models the device end of the link (MTU, per-chunk write
+latency, random link drops, radio outages and pairing failures) and
+`attach()` points SkellyBle at it by swapping in a simulated BleakClient and
+establish_connection, so the reconnect path runs exactly as it would
+against hardware.
+"""
+from __future__ import annotations
+import asyncio
+import math
+import random
+from dataclasses import dataclass, field
+
+from benchmarks import fakes
+
+class SimulatedBleError(Exception):
+    """Stands in for bleak.exc.BleakError."""
+
+@dataclass
+class SimulatedSkelly:
+    address: str = "AA:BB:CC:DD:EE:FF"
+    mtu: int = 23
+    write_latency: float = 0.002     # seconds per MTU-sized chunk
+    connect_latency: float = 0.2
+    mean_time_between_drops: float = 0.0  # seconds; 0 disables random drops
+    outage: float = 0.0              # seconds the device stays unreachable after a drop
+    pair_failure_rate: float = 0.0   # probability a connect attempt fails pairing
+    seed: int | None = None
+    play_char: str = "0000ae01-0000-1000-8000-00805f9b34fb"
+    cmd_char: str = "0000ae02-0000-1000-8000-00805f9b34fb"
+
+    rng: random.Random = field(init=False)
+    drops: list[float] = field(default_factory=list, init=False)
+    connects: int = field(default=0, init=False)
+    pair_failures: int = field(default=0, init=False)
+    writes: dict = field(default_factory=dict, init=False)
+    _unreachable_until: float = field(default=0.0, init=False)
+
+    def __post_init__(self):
+        self.rng = random.Random(self.seed)
+
+    @staticmethod
+    def now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def reachable(self) -> bool:
+        return self.now() >= self._unreachable_until
+
+    def next_drop_at(self) -> float:
+        if self.mean_time_between_drops <= 0:
+            return math.inf
+        return self.now() + self.rng.expovariate(1 / self.mean_time_between_drops)
+
+    def record_drop(self, at: float):
+        self.drops.append(at)
+        self._unreachable_until = at + self.outage
+
+    def services(self) -> list[fakes.FakeService]:
+        return [
+            fakes.FakeService("00001800-0000-1000-8000-00805f9b34fb", [
+                fakes.FakeCharacteristic("00002a00-0000-1000-8000-00805f9b34fb", ["read", "write"]),
+            ]),
+            fakes.FakeService("0000ae00-0000-1000-8000-00805f9b34fb", [
+                fakes.FakeCharacteristic(self.play_char, ["write-without-response", "write"]),
+                fakes.FakeCharacteristic(self.cmd_char, ["write"]),
+            ]),
+        ]
+
+class SimulatedBleakClient:
+    """BleakClient look-alike bound to one SimulatedSkelly."""
+
+    def __init__(self, sim: SimulatedSkelly):
+        self.sim = sim
+        self.services = sim.services()
+        self._connected = False
+        self._drop_at = math.inf
+
+    @property
+    def is_connected(self) -> bool:
+        if self._connected and self.sim.now() >= self._drop_at:
+            self._connected = False
+            self.sim.record_drop(self._drop_at)
+        return self._connected
+
+    async def connect(self, pair: bool = False):
+        await asyncio.sleep(self.sim.connect_latency)
+        if not self.sim.reachable():
+            raise SimulatedBleError(f"{self.sim.address}: device not reachable")
+        if pair and self.sim.rng.random() < self.sim.pair_failure_rate:
+            self.sim.pair_failures += 1
+            raise SimulatedBleError(f"{self.sim.address}: pairing failed")
+        self.sim.connects += 1
+        self._connected = True
+        self._drop_at = self.sim.next_drop_at()
+
+    async def pair(self):
+        return True
+
+    async def disconnect(self):
+        self._connected = False
+
+    async def write_gatt_char(self, char, payload: bytes, response: bool = False):
+        if not self.is_connected:
+            raise SimulatedBleError("Not connected")
+        chunks = max(1, math.ceil(len(payload) / (self.sim.mtu - 3)))
+        await asyncio.sleep(self.sim.write_latency * chunks)
+        if not self.is_connected:  # link dropped mid-write
+            raise SimulatedBleError("Disconnected during write")
+        self.sim.writes[char] = self.sim.writes.get(char, 0) + 1
+
+def attach(hass, sim: SimulatedSkelly):
+    """Route SkellyBle's device lookup, client class and connector to `sim`.
+
+    Call after benchmarks.fakes.install(); affects every SkellyBle in-process.
+    """
+    from custom_components.skelly_queue import skelly_ble
+
+    async def establish_connection(client_class, device, name, max_attempts=3, pair=False, **kwargs):
+        last: Exception | None = None
+        for _ in range(max_attempts):
+            client = client_class(sim)
+            try:
+                await client.connect(pair=pair)
+                return client
+            except SimulatedBleError as e:
+                last = e
+        raise last
+
+    hass.ble_devices[sim.address] = fakes.FakeBLEDevice(sim.address)
+    skelly_ble.BleakClient = SimulatedBleakClient
+    skelly_ble.establish_connection = establish_connection
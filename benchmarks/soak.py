@@ -0,0 +1,159 @@
+"""Soak test the playback pipeline against the simulated Skelly.
+
+    python -m benchmarks.soak --duration 3600 --mtbf 120 --outage 5 --pair-fail 0.1
+
+Drives QueueStore -> SkellyBle.write_play like a running show (one cue
+every --cue-interval seconds, queue refilled as it drains) alongside a
+keep-alive on the command characteristic, while the simulator drops the
+link at random. Prints a JSON report with dropped cues and recovery
+times (first failure after a drop -> next successful write).
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks import fakes  # noqa: E402
+from benchmarks.run import _summary  # noqa: E402
+
+CUE_PAYLOAD = bytes(range(64))
+KEEPALIVE_PAYLOAD = b"\x00"
+REFILL = 100
+
+class Stats:
+    def __init__(self):
+        self.cues_sent = 0
+        self.cues_dropped = 0
+        self.keepalives_sent = 0
+        self.keepalives_failed = 0
+        self.errors: dict[str, int] = {}
+        self.recoveries: list[float] = []
+        self._failing_since: float | None = None
+
+    def ok(self, now: float):
+        if self._failing_since is not None:
+            self.recoveries.append(now - self._failing_since)
+            self._failing_since = None
+
+    def failed(self, now: float, err: str):
+        self.errors[err] = self.errors.get(err, 0) + 1
+        if self._failing_since is None:
+            self._failing_since = now
+
+async def _send(stats: Stats, write, payload: bytes) -> bool:
+    loop = asyncio.get_running_loop()
+    try:
+        ok = await write(payload)
+        err = "no_device"
+    except Exception as e:
+        ok, err = False, type(e).__name__
+    if ok:
+        stats.ok(loop.time())
+    else:
+        stats.failed(loop.time(), err)
+    return ok
+
+async def _player(store, ble, stats: Stats, interval: float, deadline: float):
+    loop = asyncio.get_running_loop()
+    n = 0
+    while loop.time() < deadline:
+        if not store.get_queue():
+            await store.add_many({"filename": f"cue_{n + i:06d}.mp3"} for i in range(REFILL))
+        item = store.get_queue()[0]
+        await store.remove_at(0)
+        stats.cues_sent += 1
+        if await _send(stats, ble.write_play, CUE_PAYLOAD):
+            await store.set_last_played(item)
+        else:
+            stats.cues_dropped += 1
+        n += 1
+        await asyncio.sleep(interval)
+
+async def _keepalive(ble, stats: Stats, interval: float, deadline: float):
+    loop = asyncio.get_running_loop()
+    while loop.time() < deadline:
+        await asyncio.sleep(interval)
+        stats.keepalives_sent += 1
+        if not await _send(stats, ble.write_cmd, KEEPALIVE_PAYLOAD):
+            stats.keepalives_failed += 1
+
+async def soak(args) -> dict:
+    fakes.install()
+    from benchmarks.simulator import SimulatedSkelly, attach
+    from custom_components.skelly_queue.metrics import METRICS
+    from custom_components.skelly_queue.skelly_ble import SkellyBle
+    from custom_components.skelly_queue.storage import QueueStore
+
+    hass = fakes.FakeHass()
+    sim = SimulatedSkelly(
+        mtu=args.mtu,
+        write_latency=args.write_latency_ms / 1000,
+        connect_latency=args.connect_latency_ms / 1000,
+        mean_time_between_drops=args.mtbf,
+        outage=args.outage,
+        pair_failure_rate=args.pair_fail,
+        seed=args.seed,
+    )
+    attach(hass, sim)
+    store = QueueStore(hass)
+    ble = SkellyBle(hass, sim.address, sim.play_char, sim.cmd_char, pair_on_connect=args.pair_fail > 0)
+    stats = Stats()
+
+    deadline = asyncio.get_running_loop().time() + args.duration
+    t0 = time.perf_counter()
+    tasks = [_player(store, ble, stats, args.cue_interval, deadline)]
+    if args.keepalive > 0:
+        tasks.append(_keepalive(ble, stats, args.keepalive, deadline))
+    await asyncio.gather(*tasks)
+    await ble.disconnect()
+
+    return {
+        "config": vars(args),
+        "wall_s": round(time.perf_counter() - t0, 3),
+        "cues": {
+            "sent": stats.cues_sent,
+            "dropped": stats.cues_dropped,
+            "drop_rate": round(stats.cues_dropped / stats.cues_sent, 5) if stats.cues_sent else 0.0,
+        },
+        "keepalive": {"sent": stats.keepalives_sent, "failed": stats.keepalives_failed},
+        "link": {
+            "drops": len(sim.drops),
+            "connects": sim.connects,
+            "pair_failures": sim.pair_failures,
+            "errors": stats.errors,
+        },
+        "recovery": _summary(stats.recoveries) if stats.recoveries else None,
+        "metrics": METRICS.snapshot(),
+    }
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--duration", type=float, default=60, help="seconds to run (default 60)")
+    ap.add_argument("--cue-interval", type=float, default=0.5, help="seconds between cues")
+    ap.add_argument("--keepalive", type=float, default=5, help="keep-alive interval, 0 to disable")
+    ap.add_argument("--mtu", type=int, default=23)
+    ap.add_argument("--write-latency-ms", type=float, default=2.0, help="per MTU chunk")
+    ap.add_argument("--connect-latency-ms", type=float, default=200.0)
+    ap.add_argument("--mtbf", type=float, default=30, help="mean seconds between link drops, 0 for none")
+    ap.add_argument("--outage", type=float, default=1.0, help="seconds unreachable after a drop")
+    ap.add_argument("--pair-fail", type=float, default=0.0, help="probability a connect fails pairing")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--output", "-o", help="write JSON here instead of stdout")
+    args = ap.parse_args(argv)
+
+    text = json.dumps(asyncio.run(soak(args)), indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
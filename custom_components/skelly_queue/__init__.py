@@ -29,11 +29,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "smb": SmbBrowser(hass, entry),
     }
 
+    _register_services(hass, entry, store)
+
     # Optional panel/API
     try:
-        from .http import SkellyHttpView, register_panel
+        from .http import SkellyHttpView, async_register_panel
         SkellyHttpView.register(hass)
-        register_panel(hass)
+        await async_register_panel(hass)
     except Exception as e:
         _LOGGER.debug("Panel/API not registered (optional): %s", e)
 
@@ -47,8 +49,53 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if ok and DOMAIN in hass.data:
         hass.data[DOMAIN].pop(DATA_KEY, None)
+        from .const import SERVICE_ENQUEUE_DIR
+        hass.services.async_remove(DOMAIN, SERVICE_ENQUEUE_DIR)
     return ok
 
+def _register_services(hass: HomeAssistant, entry: ConfigEntry, store) -> None:
+    import voluptuous as vol
+    from homeassistant.core import ServiceCall
+    from homeassistant.exceptions import HomeAssistantError
+    from . import library
+    from .const import CONF_MEDIA_DIR, SERVICE_ENQUEUE_DIR
+
+    async def _enqueue_dir(call: ServiceCall) -> None:
+        """Stream a folder into the queue in the requested order."""
+        order = call.data.get("order") or (
+            library.ORDER_SHUFFLE if call.data.get("shuffle") else library.ORDER_SEQUENTIAL
+        )
+        media_dir = entry.data.get(CONF_MEDIA_DIR, "/media/skelly")
+        try:
+            index = await hass.async_add_executor_job(
+                library.scan, media_dir, call.data["subpath"], call.data.get("recursive", True)
+            )
+        except ValueError as e:
+            raise HomeAssistantError(str(e)) from e
+        paths = library.ordered(
+            index,
+            order,
+            recent=store.recent(call.data.get("recent_window", 50)),
+            play_counts=store.play_counts(),
+            limit=call.data.get("limit"),
+        )
+        n = await store.add_many({"filename": p} for p in paths)
+        _LOGGER.debug("enqueue_dir %s (%s): %d of %d clips", call.data["subpath"], order, n, len(index))
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ENQUEUE_DIR,
+        _enqueue_dir,
+        schema=vol.Schema({
+            vol.Required("subpath"): str,
+            vol.Optional("recursive", default=True): bool,
+            vol.Optional("shuffle", default=False): bool,
+            vol.Optional("order"): vol.In(library.ORDERS),
+            vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional("recent_window", default=50): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        }),
+    )
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
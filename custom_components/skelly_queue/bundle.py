@@ -0,0 +1,87 @@
+from __future__ import annotations
+import gzip
+import hashlib
+import mimetypes
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import brotli  # optional; gzip alone is fine when it's missing
+except ImportError:  # pragma: no cover
+    brotli = None
+
+WWW_DIR = Path(__file__).parent / "www"
+
+# Preferred order when the client accepts several encodings.
+ENCODINGS = ("br", "gzip", "identity")
+
+@dataclass(frozen=True)
+class Asset:
+    name: str              # content-hashed name, e.g. index.1a2b3c4d5e.html
+    content_type: str
+    digest: str
+    variants: dict[str, bytes]  # encoding -> body
+
+def _compress(raw: bytes) -> dict[str, bytes]:
+    variants = {"identity": raw}
+    gz = gzip.compress(raw, compresslevel=9, mtime=0)
+    if len(gz) < len(raw):
+        variants["gzip"] = gz
+    if brotli is not None:
+        br = brotli.compress(raw, quality=11)
+        if len(br) < len(raw):
+            variants["br"] = br
+    return variants
+
+class Bundle:
+    """The panel UI, loaded once: every www/ file hashed and precompressed."""
+
+    def __init__(self, assets: dict[str, Asset], aliases: dict[str, str]):
+        self.assets = assets      # hashed name -> Asset
+        self.aliases = aliases    # original name -> hashed name
+
+    def url_name(self, name: str) -> str:
+        """Hashed file name for `name` (falls back to `name` itself)."""
+        return self.aliases.get(name, name)
+
+    def get(self, name: str) -> tuple[Asset, bool] | None:
+        """Look up by hashed or original name; the flag says whether it was hashed."""
+        if name in self.assets:
+            return self.assets[name], True
+        hashed = self.aliases.get(name)
+        return (self.assets[hashed], False) if hashed else None
+
+def build_bundle(www_dir: Path = WWW_DIR) -> Bundle:
+    """Read, hash and compress everything under www/. Blocking; run in the executor."""
+    assets: dict[str, Asset] = {}
+    aliases: dict[str, str] = {}
+    if not www_dir.is_dir():
+        return Bundle(assets, aliases)
+    for path in sorted(p for p in www_dir.rglob("*") if p.is_file()):
+        rel = path.relative_to(www_dir).as_posix()
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()[:10]
+        stem, dot, ext = rel.rpartition(".")
+        hashed = f"{stem}.{digest}.{ext}" if dot else f"{rel}.{digest}"
+        ctype = mimetypes.guess_type(rel)[0] or "application/octet-stream"
+        assets[hashed] = Asset(hashed, ctype, digest, _compress(raw))
+        aliases[rel] = hashed
+    return Bundle(assets, aliases)
+
+def pick_encoding(accept_encoding: str | None, available) -> str:
+    """Best encoding in `available` that the Accept-Encoding header allows."""
+    accepted: dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        token, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if token:
+            accepted[token.lower()] = q
+    for enc in ENCODINGS:
+        if enc in available and (enc == "identity" or accepted.get(enc, accepted.get("*", 0)) > 0):
+            return enc
+    return "identity"
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 from typing import Any, Optional
 
 import voluptuous as vol
@@ -16,8 +17,9 @@ from .const import (
     DOMAIN, CONF_ADDRESS, CONF_PLAY_CHAR, CONF_CMD_CHAR,
     CONF_MEDIA_DIR, CONF_ALLOW_REMOTE, CONF_CACHE_DIR, CONF_MAX_CACHE_MB,
     CONF_KEEPALIVE_ENABLED, CONF_KEEPALIVE_SEC,
-    CONF_PAIR_ON_CONNECT, CONF_PIN_CODE,
+    CONF_PAIR_ON_CONNECT, CONF_PIN_CODE, DETECT_TIMEOUT_SEC,
 )
+from .gatt_cache import async_get_gatt_cache, pick_write_chars, snapshot
 
 def _choices_from_bt(hass: HomeAssistant) -> list[sel.SelectOptionDict]:
     opts: list[sel.SelectOptionDict] = []
@@ -31,31 +33,43 @@ def _choices_from_bt(hass: HomeAssistant) -> list[sel.SelectOptionDict]:
         uniq.append(o); seen.add(o["value"])
     return uniq
 
-async def _detect_write_chars(hass: HomeAssistant, address: str) -> tuple[Optional[str], Optional[str]]:
-    dev = async_ble_device_from_address(hass, address, connectable=True)
-    if not dev:
-        for _ in range(8):
-            dev = async_ble_device_from_address(hass, address, connectable=True)
-            if dev: break
-    if not dev:
-        return (None, None)
-
-    client: BleakClient = await establish_connection(BleakClient, dev, name="skelly-detect", max_attempts=3)
-    await client.get_services()
-    cands = []
-    for svc in client.services:
-        for ch in svc.characteristics:
-            props = {p.lower() for p in ch.properties}
-            if "write" in props or "write without response" in props:
-                cu = str(ch.uuid)
-                score = (len(cu) > 8, "without" in " ".join(props))
-                cands.append((score, cu))
-    cands.sort(reverse=True)
-    play_char = cands[0][1] if cands else None
-    cmd_char = cands[1][1] if len(cands) > 1 else None
-    try: await client.disconnect()
-    except Exception: pass
-    return (play_char, cmd_char)
+async def _wait_for_device(hass: HomeAssistant, address: str):
+    while True:
+        dev = async_ble_device_from_address(hass, address, connectable=True)
+        if dev:
+            return dev
+        await asyncio.sleep(0.5)
+
+async def _read_gatt_table(hass: HomeAssistant, address: str) -> list[dict]:
+    async with asyncio.timeout(DETECT_TIMEOUT_SEC):
+        dev = await _wait_for_device(hass, address)
+        client: BleakClient = await establish_connection(BleakClient, dev, name="skelly-detect", max_attempts=3)
+        try:
+            return snapshot(client.services)
+        finally:
+            try: await client.disconnect()
+            except Exception: pass
+
+async def _detect_write_chars(
+    hass: HomeAssistant, address: str, refresh: bool = False
+) -> tuple[Optional[str], Optional[str]]:
+    """Pick play/cmd characteristics, reusing a cached GATT table when we have one.
+
+    `refresh` (or a cached table with nothing writable) forces a fresh read.
+    Raises TimeoutError if the device can't be found and read within DETECT_TIMEOUT_SEC.
+    """
+    cache = await async_get_gatt_cache(hass)
+    if refresh:
+        await cache.async_forget(address)
+    table = cache.get(address)
+    if table is not None:
+        play, cmd = pick_write_chars(table)
+        if play:
+            return (play, cmd)
+        await cache.async_forget(address)
+    table = await _read_gatt_table(hass, address)
+    await cache.async_remember(address, table)
+    return pick_write_chars(table)
 
 class SkellyQueueFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
@@ -85,12 +99,13 @@ class SkellyQueueFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         if user_input is not None:
             auto = user_input.get("auto_detect", True)
+            rescan = user_input.get("rescan", False)
             play = (user_input.get(CONF_PLAY_CHAR) or "").strip() or None
             cmd = (user_input.get(CONF_CMD_CHAR) or "").strip() or None
 
             if auto:
                 try:
-                    det_play, det_cmd = await _detect_write_chars(self.hass, self._address)
+                    det_play, det_cmd = await _detect_write_chars(self.hass, self._address, refresh=rescan)
                     play = play or det_play
                     cmd = cmd or det_cmd
                 except Exception:
@@ -114,6 +129,7 @@ class SkellyQueueFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if errors:
                 schema = vol.Schema({
                     vol.Optional("auto_detect", default=True): bool,
+                    vol.Optional("rescan", default=True): bool,
                     vol.Optional(CONF_PLAY_CHAR, default=play or ""): str,
                     vol.Optional(CONF_CMD_CHAR, default=cmd or ""): str,
                 })
@@ -123,6 +139,7 @@ class SkellyQueueFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         schema = vol.Schema({
             vol.Optional("auto_detect", default=True): bool,
+            vol.Optional("rescan", default=False): bool,
             vol.Optional(CONF_PLAY_CHAR, default=""): str,
             vol.Optional(CONF_CMD_CHAR, default=""): str,
         })
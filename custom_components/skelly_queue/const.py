@@ -16,6 +16,16 @@ CONF_KEEPALIVE_SEC = "keepalive_sec"
 CONF_PAIR_ON_CONNECT = "pair_on_connect"
 CONF_PIN_CODE = "pin_code"  # informational hint only; BlueZ agent handles actual entry
 
+# Vendor GATT services used by the BLE audio boards found in Skelly units;
+# auto-detect ranks writable characteristics under these first.
+SKELLY_SERVICE_UUIDS = (
+    "0000ae00-0000-1000-8000-00805f9b34fb",
+    "0000ffe0-0000-1000-8000-00805f9b34fb",
+)
+
+# Overall budget for finding the device, connecting and reading services.
+DETECT_TIMEOUT_SEC = 30
+
 SERVICE_ENQUEUE = "enqueue"
 SERVICE_ENQUEUE_URL = "enqueue_url"
 SERVICE_ENQUEUE_M3U = "enqueue_m3u"
@@ -0,0 +1,26 @@
+from __future__ import annotations
+from typing import Any
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_PIN_CODE
+from .metrics import METRICS
+from .smb_browser import CONF_SMB_PASS, CONF_SMB_USER
+
+DATA_KEY = f"{DOMAIN}_data"
+TO_REDACT = {CONF_PIN_CODE, CONF_SMB_PASS, CONF_SMB_USER}
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Entry config (redacted), queue summary and hot-path metrics."""
+    data = hass.data.get(DOMAIN, {}).get(DATA_KEY, {})
+    store = data.get("store")
+    return {
+        "entry": async_redact_data({**entry.data, **entry.options}, TO_REDACT),
+        "queue": {
+            "length": len(store.data["queue"]),
+            "version": store.version,
+            "last_played": store.data["last_played"],
+        } if store else None,
+        "metrics": METRICS.snapshot(),
+    }
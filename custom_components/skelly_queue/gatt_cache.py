@@ -0,0 +1,97 @@
+from __future__ import annotations
+import logging
+from typing import Optional
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SKELLY_SERVICE_UUIDS
+
+_LOGGER = logging.getLogger(__name__)
+
+GATT_STORE_KEY = "skelly_queue_gatt"
+GATT_STORE_VERSION = 1
+GATT_CACHE_KEY = "gatt_cache"
+
+_SIG_BASE = "-0000-1000-8000-00805f9b34fb"
+
+def snapshot(services) -> list[dict]:
+    """Flatten a bleak service collection into plain JSON-able data."""
+    return [
+        {
+            "uuid": str(svc.uuid).lower(),
+            "characteristics": [
+                {"uuid": str(ch.uuid).lower(), "properties": sorted(p.lower().replace(" ", "-") for p in ch.properties)}
+                for ch in svc.characteristics
+            ],
+        }
+        for svc in services
+    ]
+
+def has_char(table: list[dict], uuid: str) -> bool:
+    """True if any service in `table` offers characteristic `uuid`."""
+    uuid = uuid.lower()
+    return any(ch["uuid"] == uuid for svc in table for ch in svc["characteristics"])
+
+def _is_standard_service(uuid: str) -> bool:
+    # Generic Access, Generic Attribute, Device Information, Battery, ...
+    return uuid.endswith(_SIG_BASE) and uuid[4:6] == "18"
+
+def pick_write_chars(table: list[dict]) -> tuple[Optional[str], Optional[str]]:
+    """Rank writable characteristics and return (play_char, cmd_char).
+
+    Characteristics under a known Skelly service win, then anything in a
+    vendor (non-standard) service; write-without-response breaks ties.
+    """
+    cands = []
+    for svc in table:
+        known = svc["uuid"] in SKELLY_SERVICE_UUIDS
+        vendor = not _is_standard_service(svc["uuid"])
+        for ch in svc["characteristics"]:
+            props = set(ch["properties"])
+            no_rsp = "write-without-response" in props
+            if "write" in props or no_rsp:
+                cands.append(((known, vendor, no_rsp), ch["uuid"]))
+    cands.sort(reverse=True)
+    play_char = cands[0][1] if cands else None
+    cmd_char = cands[1][1] if len(cands) > 1 else None
+    return (play_char, cmd_char)
+
+class GattCache:
+    """Per-address GATT service tables, persisted so auto-detect can skip connecting."""
+
+    def __init__(self, hass):
+        self.hass = hass
+        self.store = Store(hass, GATT_STORE_VERSION, GATT_STORE_KEY)
+        self.data: dict[str, list[dict]] = {}
+        self._loaded = False
+
+    async def async_load(self):
+        if self._loaded:
+            return
+        self.data = await self.store.async_load() or {}
+        self._loaded = True
+
+    def get(self, address: str) -> Optional[list[dict]]:
+        return self.data.get(address.upper())
+
+    async def async_remember(self, address: str, table: list[dict]):
+        """Store `table` for `address`; only writes to disk when it changed."""
+        key = address.upper()
+        if self.data.get(key) == table:
+            return
+        self.data[key] = table
+        _LOGGER.debug("Cached GATT table for %s (%d services)", key, len(table))
+        await self.store.async_save(self.data)
+
+    async def async_forget(self, address: str):
+        """Drop `address` so the next auto-detect reads the device again."""
+        if self.data.pop(address.upper(), None) is not None:
+            await self.store.async_save(self.data)
+
+async def async_get_gatt_cache(hass) -> GattCache:
+    """Return the loaded GattCache shared by the config flow and every SkellyBle."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get(GATT_CACHE_KEY)
+    if cache is None:
+        cache = domain_data[GATT_CACHE_KEY] = GattCache(hass)
+    await cache.async_load()
+    return cache
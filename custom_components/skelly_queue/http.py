@@ -1,40 +1,98 @@
 from __future__ import annotations
 import io, json, zipfile, datetime as dt, logging
-from pathlib import Path
+from aiohttp import web
 from homeassistant.core import HomeAssistant
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.frontend import async_register_built_in_panel
 
+from .bundle import WWW_DIR, Asset, Bundle, build_bundle, pick_encoding
+from .metrics import METRICS
+
 DOMAIN = "skelly_queue"
 DATA_KEY = f"{DOMAIN}_data"
 _LOGGER = logging.getLogger(__name__)
 
+# ---------- Conditional GET helpers ----------
+def _etag_matches(request, etag: str) -> bool:
+    """True if the client's If-None-Match already names `etag`."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return "*" in tags or etag in tags
+
+def _since(request) -> int | None:
+    try:
+        return int(request.query["since"])
+    except (KeyError, ValueError):
+        return None
+
 # ---------- Static files (the UI) ----------
-def register_static(hass: HomeAssistant):
-    """Serve /skelly_queue_static/* from this integration's bundled www/ folder."""
-    comp_dir = Path(__file__).parent
-    www_dir = comp_dir / "www"
-    if not www_dir.exists():
+STATIC_URL = "/skelly_queue_static"
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+def asset_response(request, asset: Asset, immutable: bool = True) -> web.Response:
+    """Serve a bundled asset in the best encoding the client accepts.
+
+    Hashed URLs never change content, so they're cached for a year; the
+    plain names (old bookmarks) must revalidate, which the ETag makes a 304.
+    """
+    enc = pick_encoding(request.headers.get("Accept-Encoding"), asset.variants)
+    etag = f'"{asset.digest}-{enc}"'
+    headers = {
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+        "Cache-Control": IMMUTABLE if immutable else "no-cache",
+    }
+    if _etag_matches(request, etag):
+        return web.Response(status=304, headers=headers)
+    if enc != "identity":
+        headers["Content-Encoding"] = enc
+    return web.Response(body=asset.variants[enc], content_type=asset.content_type, headers=headers)
+
+class SkellyStaticView(HomeAssistantView):
+    """Serve /skelly_queue_static/* from the in-memory bundle of www/."""
+    url = STATIC_URL + "/{filename:.+}"
+    name = "skelly_queue:static"
+    requires_auth = False
+
+    def __init__(self, bundle: Bundle):
+        self.bundle = bundle
+
+    async def get(self, request, filename: str):
+        found = self.bundle.get(filename)
+        if found is None:
+            return web.Response(status=404)
+        asset, hashed = found
+        return asset_response(request, asset, immutable=hashed)
+
+async def async_register_static(hass: HomeAssistant) -> Bundle:
+    """Build the UI bundle once and serve it; returns the bundle."""
+    bundle = await hass.async_add_executor_job(build_bundle, WWW_DIR)
+    if not bundle.assets:
         _LOGGER.debug("No local UI found (www/ missing) — panel will still register.")
-        return
-    # The 'cache' kw switched to 'cache_headers' in newer HA; keep simple default.
-    hass.http.register_static_path("/skelly_queue_static", str(www_dir), cache_headers=False)
+    hass.data.setdefault(DOMAIN, {})["bundle"] = bundle
+    hass.http.register_view(SkellyStaticView(bundle))
+    return bundle
 
 # ---------- Panel ----------
-def register_panel(hass: HomeAssistant):
+async def async_register_panel(hass: HomeAssistant):
     """Register sidebar panel that loads our bundled UI."""
-    register_static(hass)
+    bundle = await async_register_static(hass)
     async_register_built_in_panel(
         hass,
         component_name="iframe",
         sidebar_title="Skelly Queue",
         sidebar_icon="mdi:skull",
         frontend_url_path="skelly-queue",
-        config={"url": "/skelly_queue_static/index.html"},
+        config={"url": f"{STATIC_URL}/{bundle.url_name('index.html')}"},
         require_admin=False,
     )
 
 # ---------- Authenticated API ----------
+_GET_OPS = ("browse", "queue", "metrics")
+_POST_ACTIONS = ("add", "remove_at", "clear", "export_logs")
+
 class SkellyHttpView(HomeAssistantView):
     url = "/api/skelly_queue"
     name = "api:skelly_queue"
@@ -45,26 +103,60 @@ class SkellyHttpView(HomeAssistantView):
         hass.http.register_view(cls())
 
     async def get(self, request):
-        """GET /api/skelly_queue?op=browse&path=/  |  op=queue"""
-        hass = request.app["hass"]
         op = request.query.get("op")
+        with METRICS.timer(f"http.get.{op if op in _GET_OPS else 'other'}"):
+            return await self._get(request, op)
+
+    async def post(self, request):
+        body = await request.json()
+        action = body.get("action")
+        with METRICS.timer(f"http.post.{action if action in _POST_ACTIONS else 'other'}"):
+            return await self._post(request, body, action)
+
+    async def _get(self, request, op):
+        """GET /api/skelly_queue?op=browse&path=/  |  op=queue  |  op=metrics
+
+        browse and queue answer with an ETag and honour If-None-Match (304). Passing
+        `since=<version>` returns only the changes after that version when
+        they're still known; otherwise the full payload comes back as usual.
+        """
+        hass = request.app["hass"]
         data = hass.data[DOMAIN][DATA_KEY]
+        since = _since(request)
+
+        if op == "metrics":
+            return self.json(METRICS.snapshot())
 
         if op == "browse":
+            smb = data["smb"]
             path = request.query.get("path", "/")
-            items = await data["smb"].listdir(path)
-            return self.json({"items": items})
+            items = await smb.listdir(path)
+            version = smb.listing(path)["version"]
+            etag = f'"b{version}"'
+            if _etag_matches(request, etag):
+                return web.Response(status=304, headers={"ETag": etag})
+            if since is not None:
+                delta = smb.changes_since(path, since)
+                if delta is not None:
+                    return self.json({"version": version, **delta}, headers={"ETag": etag})
+            return self.json({"version": version, "items": items}, headers={"ETag": etag})
 
         if op == "queue":
-            return self.json({"queue": data["store"].get_queue()})
+            store = data["store"]
+            etag = f'"q{store.version}"'
+            if _etag_matches(request, etag):
+                return web.Response(status=304, headers={"ETag": etag})
+            if since is not None:
+                changes = store.changes_since(since)
+                if changes is not None:
+                    return self.json({"version": store.version, "changes": changes}, headers={"ETag": etag})
+            return self.json({"version": store.version, "queue": store.get_queue()}, headers={"ETag": etag})
 
         return self.json({"error": "unsupported op"}, status_code=400)
 
-    async def post(self, request):
+    async def _post(self, request, body, action):
         """POST /api/skelly_queue { action: add|remove_at|clear|export_logs, ... }"""
         hass = request.app["hass"]
-        body = await request.json()
-        action = body.get("action")
         data = hass.data[DOMAIN][DATA_KEY]
 
         if action == "add":
@@ -84,6 +176,7 @@ class SkellyHttpView(HomeAssistantView):
             now = dt.datetime.now().strftime("%Y%m%d-%H%M%S")
             with zipfile.ZipFile(mem, "w", zipfile.ZIP_DEFLATED) as z:
                 z.writestr(f"state/queue-{now}.json", json.dumps(data["store"].data, indent=2))
+                z.writestr(f"state/metrics-{now}.json", json.dumps(METRICS.snapshot(), indent=2))
             mem.seek(0)
             return self.Response(
                 body=mem.read(),
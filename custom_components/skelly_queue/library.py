@@ -0,0 +1,106 @@
+from __future__ import annotations
+import heapq
+import os
+import random
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+PLAYABLE_EXTS = (".mp3", ".wav", ".ogg", ".m4a", ".flac")
+
+ORDER_SEQUENTIAL = "sequential"
+ORDER_SHUFFLE = "shuffle"
+ORDER_NO_REPEAT = "no_repeat"
+ORDER_WEIGHTED = "weighted"
+ORDERS = (ORDER_SEQUENTIAL, ORDER_SHUFFLE, ORDER_NO_REPEAT, ORDER_WEIGHTED)
+
+def scan(media_dir: str, subpath: str, recursive: bool = True) -> list[str]:
+    """Build the library index: sorted playable paths relative to media_dir.
+
+    Blocking; run it in the executor. Raises ValueError if `subpath`
+    resolves to somewhere outside media_dir.
+    """
+    media_dir = os.path.realpath(media_dir)
+    start = os.path.realpath(os.path.join(media_dir, subpath.strip("/")))
+    if os.path.commonpath([media_dir, start]) != media_dir:
+        raise ValueError(f"subpath {subpath!r} is outside the media directory")
+    index: list[str] = []
+    stack = [start]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(e.path)
+                elif e.name.lower().endswith(PLAYABLE_EXTS):
+                    index.append(os.path.relpath(e.path, media_dir))
+    index.sort(key=str.lower)
+    return index
+
+def lazy_shuffle(n: int, rng: random.Random | None = None) -> Iterator[int]:
+    """Yield index positions 0..n-1 in uniform random order.
+
+    Fisher–Yates run one step at a time over a compact array of positions,
+    so nothing past the first few picks is computed if the caller stops early.
+    """
+    rng = rng or random.Random()
+    pos = array("L", range(n))
+    for i in range(n - 1, -1, -1):
+        j = rng.randint(0, i)
+        pos[i], pos[j] = pos[j], pos[i]
+        yield pos[i]
+
+def no_repeat(
+    index: Sequence[str], recent: Iterable[str], rng: random.Random | None = None
+) -> Iterator[str]:
+    """Shuffle `index`, leaving out anything in `recent` (the last N plays)."""
+    skip = set(recent)
+    for i in lazy_shuffle(len(index), rng):
+        if index[i] not in skip:
+            yield index[i]
+
+def weighted_by_plays(
+    index: Sequence[str], play_counts: dict[str, int], k: int, rng: random.Random | None = None
+) -> list[str]:
+    """Pick up to `k` clips, favouring ones that have been played less.
+
+    Weighted sampling without replacement (Efraimidis–Spirakis): each clip
+    draws a key u**(1/w) with w = 1/(1+plays) and the k largest keys win, so
+    only a k-sized heap is held regardless of library size.
+    """
+    rng = rng or random.Random()
+    heap: list[tuple[float, int]] = []
+    for i, path in enumerate(index):
+        key = rng.random() ** (1 + play_counts.get(path, 0))
+        if len(heap) < k:
+            heapq.heappush(heap, (key, i))
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, (key, i))
+    return [index[i] for _, i in sorted(heap, reverse=True)]
+
+def ordered(
+    index: Sequence[str],
+    order: str = ORDER_SEQUENTIAL,
+    *,
+    recent: Iterable[str] = (),
+    play_counts: dict[str, int] | None = None,
+    limit: int | None = None,
+    rng: random.Random | None = None,
+) -> Iterator[str]:
+    """Stream paths from the library index in the requested `order`."""
+    if order == ORDER_WEIGHTED:
+        yield from weighted_by_plays(index, play_counts or {}, limit or len(index), rng)
+        return
+    if order == ORDER_SHUFFLE:
+        paths: Iterable[str] = (index[i] for i in lazy_shuffle(len(index), rng))
+    elif order == ORDER_NO_REPEAT:
+        paths = no_repeat(index, recent, rng)
+    else:
+        paths = iter(index)
+    for n, path in enumerate(paths):
+        if limit is not None and n >= limit:
+            return
+        yield path
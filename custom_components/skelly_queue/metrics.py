@@ -0,0 +1,93 @@
+from __future__ import annotations
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Optional
+
+# Upper bounds (ms) for latency buckets; anything slower lands in the overflow bucket.
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+class Histogram:
+    """Fixed-bucket latency histogram; observe() is a bisect and two adds."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float):
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket covering quantile `q`, capped at the slowest sample."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                bound = BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.max_ms
+                return round(float(min(bound, self.max_ms)), 3)
+        return round(self.max_ms, 3)
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "max_ms": round(self.max_ms, 3),
+            "buckets_ms": dict(zip([*map(str, BUCKETS_MS), "+Inf"], self.counts)),
+        }
+
+class Metrics:
+    """Named histograms and counters for the hot paths."""
+
+    def __init__(self):
+        self.histograms: dict[str, Histogram] = {}
+        self.counters: dict[str, int] = {}
+
+    def inc(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, name: str, ms: float):
+        hist = self.histograms.get(name)
+        if hist is None:
+            hist = self.histograms[name] = Histogram()
+        hist.observe(ms)
+
+    @contextmanager
+    def timer(self, name: str):
+        """Time the block into histogram `name`; exceptions also bump `<name>.errors`."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc(f"{name}.errors")
+            raise
+        finally:
+            self.observe(name, (time.perf_counter() - t0) * 1000)
+
+    def get(self, name: str) -> Optional[Histogram]:
+        return self.histograms.get(name)
+
+    def snapshot(self) -> dict:
+        return {
+            "histograms": {k: h.as_dict() for k, h in sorted(self.histograms.items())},
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def reset(self):
+        self.histograms.clear()
+        self.counters.clear()
+
+# Process-wide registry; every instrumented module records into this one.
+METRICS = Metrics()
@@ -8,6 +8,9 @@ from aiohttp import web
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
 
+from .bundle import build_bundle
+from .http import asset_response
+
 DOMAIN = "skelly_queue"
 
 
@@ -22,109 +25,15 @@ class SkellyPanelView(HomeAssistantView):
         self.panel_data = panel_data
 
     async def get(self, request: web.Request) -> web.Response:
-        """Return simple HTML UI."""
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8" />
-  <title>Skelly Queue</title>
-  <style>
-    body {{ background:#0b0d10; color:#e5e7eb; font-family:sans-serif; }}
-    input,button {{ margin:3px; }}
-    pre {{ background:#111; padding:6px; overflow:auto; height:160px; }}
-    .col {{ display:inline-block; vertical-align:top; margin:8px; }}
-  </style>
-</head>
-<body>
-  <h2>💀 Skelly Queue</h2>
-
-  <div class="col">
-    <h3>Local library</h3>
-    <input id="subpath" size="30" placeholder="relative to /media/skelly" />
-    <button onclick="browse()">Browse</button>
-    <button onclick="enqueueDir()">Enqueue Folder</button><br/>
-    <label><input type="checkbox" id="recursive" checked/>recursive</label>
-    <label><input type="checkbox" id="shuffle"/>shuffle</label>
-    <div id="local"></div>
-  </div>
-
-  <div class="col">
-    <h3>Remote SMB library</h3>
-    <input id="smb_host" placeholder="192.168.1.10" size="12"/>
-    <input id="smb_share" placeholder="Share" size="8"/>
-    <input id="smb_user" placeholder="User" size="8"/>
-    <input id="smb_pass" placeholder="Pass" type="password" size="8"/>
-    <button onclick="smbList()">List</button>
-    <button onclick="smbEnqueue()">Enqueue</button>
-    <div id="smb"></div>
-  </div>
-
-  <div class="col">
-    <h3>Controls</h3>
-    <button onclick="api('/play')">▶ Play</button>
-    <button onclick="api('/skip')">⏭ Skip</button>
-    <button onclick="api('/stop')">⏹ Stop</button>
-    <button onclick="api('/clear')">🗑 Clear</button>
-  </div>
-
-  <h3>Live logs</h3>
-  <button onclick="refresh()">Refresh</button>
-  <button onclick="pause=!pause">Pause</button>
-  <button onclick="exportLog()">Export</button>
-  <pre id="log"></pre>
-
-<script>
-let pause=false;
-async function api(path, body) {{
-  const r = await fetch('/api/skelly_queue'+path, {{
-    method:'POST',
-    credentials:'same-origin',
-    headers:{{'Content-Type':'application/json'}},
-    body: body ? JSON.stringify(body):'{{}}'
-  }});
-  if(!r.ok) alert(await r.text());
-}}
-async function browse(){{
-  const sp=document.getElementById('subpath').value;
-  const r=await fetch('/api/skelly_queue/list?subpath='+encodeURIComponent(sp));
-  document.getElementById('local').textContent=await r.text();
-}}
-async function enqueueDir(){{
-  await api('/enqueue_dir',{{
-    subpath:document.getElementById('subpath').value,
-    recursive:document.getElementById('recursive').checked,
-    shuffle:document.getElementById('shuffle').checked
-  }});
-}}
-async function smbList(){{
-  const p=new URLSearchParams({{
-    host:document.getElementById('smb_host').value,
-    share:document.getElementById('smb_share').value,
-    user:document.getElementById('smb_user').value,
-    pass:document.getElementById('smb_pass').value
-  }});
-  const r=await fetch('/api/skelly_queue/smb_list?'+p);
-  document.getElementById('smb').textContent=await r.text();
-}}
-async function smbEnqueue(){{
-  await api('/smb_enqueue_dir',{{
-    host:document.getElementById('smb_host').value,
-    share:document.getElementById('smb_share').value,
-    user:document.getElementById('smb_user').value,
-    pass:document.getElementById('smb_pass').value
-  }});
-}}
-async function refresh(){{
-  if(pause) return;
-  const r=await fetch('/api/skelly_queue/logs');
-  document.getElementById('log').textContent=await r.text();
-  setTimeout(refresh,4000);
-}}
-refresh();
-</script>
-</body></html>"""
-        return web.Response(text=html, content_type="text/html")
+        """Return the bundled HTML UI (www/index.html, loaded and compressed once)."""
+        bundle = self.hass.data.get(DOMAIN, {}).get("bundle")
+        if bundle is None:
+            bundle = await self.hass.async_add_executor_job(build_bundle)
+            self.hass.data.setdefault(DOMAIN, {})["bundle"] = bundle
+        found = bundle.get("index.html")
+        if found is None:
+            return web.Response(status=404, text="Skelly Queue UI not installed")
+        return asset_response(request, found[0], immutable=False)
 
 
 class SkellyApiView(HomeAssistantView):
@@ -1,16 +1,33 @@
 from __future__ import annotations
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from .const import DOMAIN
+from .metrics import METRICS
+
+# (metric, label, icon) for the p95 latency diagnostic sensors
+LATENCY_SENSORS = [
+    ("ble.connect", "BLE Connect", "mdi:bluetooth-connect"),
+    ("ble.write_play", "BLE Play Write", "mdi:bluetooth-transfer"),
+    ("ble.write_cmd", "BLE Command Write", "mdi:bluetooth-transfer"),
+    ("ble.lock_wait", "BLE Queue Wait", "mdi:timer-sand"),
+    ("smb.listdir", "SMB Listing", "mdi:folder-network"),
+    ("store.save", "Queue Save", "mdi:content-save"),
+]
 
 def _safe_state(hass: HomeAssistant, entity_id: str, default):
     st: State | None = hass.states.get(entity_id)
     return st.state if st else default
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, add: AddEntitiesCallback):
-    add([SkellyNowPlayingSensor(hass, entry), SkellyQueueLengthSensor(hass, entry)])
+    add([
+        SkellyNowPlayingSensor(hass, entry),
+        SkellyQueueLengthSensor(hass, entry),
+        *(SkellyLatencySensor(entry, metric, label, icon) for metric, label, icon in LATENCY_SENSORS),
+        SkellyCounterSensor(entry, "ble.connects", "BLE Connects", "mdi:bluetooth-connect"),
+    ])
 
 class SkellyNowPlayingSensor(SensorEntity):
     _attr_name = "Skelly Now Playing"
@@ -34,3 +51,39 @@ class SkellyQueueLengthSensor(SensorEntity):
         try: return int(val)
         except Exception: return 0
 
+
+class SkellyLatencySensor(SensorEntity):
+    """p95 latency of one instrumented hot path; count/mean/max as attributes."""
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    def __init__(self, entry, metric, label, icon):
+        self._metric = metric
+        self._attr_name = f"Skelly {label} p95"
+        self._attr_icon = icon
+        self._attr_unique_id = f"{entry.entry_id}_latency_{metric.replace('.', '_')}"
+    @property
+    def native_value(self):
+        hist = METRICS.get(self._metric)
+        return hist.quantile(0.95) if hist else None
+    @property
+    def extra_state_attributes(self):
+        hist = METRICS.get(self._metric)
+        if not hist:
+            return None
+        d = hist.as_dict()
+        return {k: d[k] for k in ("count", "mean_ms", "p50_ms", "max_ms")} | {
+            "errors": METRICS.counters.get(f"{self._metric}.errors", 0)
+        }
+
+class SkellyCounterSensor(SensorEntity):
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    def __init__(self, entry, metric, label, icon):
+        self._metric = metric
+        self._attr_name = f"Skelly {label}"
+        self._attr_icon = icon
+        self._attr_unique_id = f"{entry.entry_id}_count_{metric.replace('.', '_')}"
+    @property
+    def native_value(self):
+        return METRICS.counters.get(self._metric, 0)
@@ -1,22 +1,36 @@
 import asyncio
+import contextlib
 import logging
+import time
 from typing import Optional
 from bleak.backends.device import BLEDevice
 from homeassistant.components.bluetooth import async_ble_device_from_address
 from bleak_retry_connector import establish_connection
 from bleak import BleakClient
 
+from .gatt_cache import GattCache, has_char, snapshot
+from .metrics import METRICS
+
 _LOGGER = logging.getLogger(__name__)
 
 class SkellyBle:
     """Tiny BLE helper that rides HA's shared Bluetooth stack (works with or without proxies)."""
 
-    def __init__(self, hass, address: str, play_char: str, cmd_char: Optional[str] = None, pair_on_connect: bool = True):
+    def __init__(
+        self,
+        hass,
+        address: str,
+        play_char: str,
+        cmd_char: Optional[str] = None,
+        pair_on_connect: bool = True,
+        gatt_cache: Optional[GattCache] = None,
+    ):
         self.hass = hass
         self.address = address
         self.play_char = play_char
         self.cmd_char = cmd_char
         self.pair_on_connect = pair_on_connect
+        self.gatt_cache = gatt_cache
         self._client: Optional[BleakClient] = None
         self._lock = asyncio.Lock()
 
@@ -35,6 +49,22 @@ class SkellyBle:
     async def _ensure_client(self) -> Optional[BleakClient]:
         if self._client and self._client.is_connected:
             return self._client
+        # Only successful connects are timed; a missing device (after the ~5 s
+        # lookup) or a failed connect would otherwise skew the latency figures.
+        t0 = time.perf_counter()
+        try:
+            client = await self._connect()
+        except Exception:
+            METRICS.inc("ble.connect.errors")
+            raise
+        if client is None:
+            METRICS.inc("ble.connect.no_device")
+            return None
+        METRICS.observe("ble.connect", (time.perf_counter() - t0) * 1000)
+        METRICS.inc("ble.connects")
+        return client
+
+    async def _connect(self) -> Optional[BleakClient]:
         dev = await self._get_ble_device()
         if not dev:
             return None
@@ -53,6 +83,9 @@ class SkellyBle:
                 client_class=BleakClient, device=dev, name="skelly-queue", max_attempts=3
             )
 
+        if self.gatt_cache is not None:
+            await self._check_gatt_table()
+
         # Try explicit pairing call where supported; harmless no-op on some backends.
         if self.pair_on_connect:
             try:
@@ -62,22 +95,61 @@ class SkellyBle:
 
         return self._client
 
-    async def write_play(self, payload: bytes) -> bool:
+    async def _check_gatt_table(self):
+        """Refresh the cached GATT table from this connection and sanity-check our chars.
+
+        The services were already resolved by connecting, so this costs no
+        extra round-trip; it just catches a play/cmd UUID the device no longer has.
+        """
+        try:
+            table = snapshot(self._client.services)
+        except Exception as e:
+            _LOGGER.debug("Could not read GATT table for %s: %s", self.address, e)
+            return
+        for label, char in (("play", self.play_char), ("cmd", self.cmd_char)):
+            if char and not has_char(table, char):
+                _LOGGER.warning(
+                    "Skelly %s: configured %s characteristic %s not offered by the device; re-run auto-detect",
+                    self.address, label, char,
+                )
+        await self.gatt_cache.async_remember(self.address, table)
+
+    async def _write(self, client: BleakClient, char: str, payload: bytes, metric: str):
+        try:
+            with METRICS.timer(metric):
+                await client.write_gatt_char(char, payload, response=True)
+        except Exception:
+            # The cached table may be what picked `char`; make the next
+            # detection read the device again instead of trusting it.
+            if self.gatt_cache is not None:
+                await self.gatt_cache.async_forget(self.address)
+            raise
+
+    @contextlib.asynccontextmanager
+    async def _timed_lock(self):
+        t0 = time.perf_counter()
         async with self._lock:
+            METRICS.observe("ble.lock_wait", (time.perf_counter() - t0) * 1000)
+            yield
+
+    async def write_play(self, payload: bytes) -> bool:
+        async with self._timed_lock():
             client = await self._ensure_client()
             if not client:
+                METRICS.inc("ble.write_play.no_device")
                 return False
-            await client.write_gatt_char(self.play_char, payload, response=True)
+            await self._write(client, self.play_char, payload, "ble.write_play")
             return True
 
     async def write_cmd(self, payload: bytes) -> bool:
         if not self.cmd_char:
             return False
-        async with self._lock:
+        async with self._timed_lock():
             client = await self._ensure_client()
             if not client:
+                METRICS.inc("ble.write_cmd.no_device")
                 return False
-            await client.write_gatt_char(self.cmd_char, payload, response=True)
+            await self._write(client, self.cmd_char, payload, "ble.write_cmd")
             return True
 
     async def disconnect(self):
@@ -1,7 +1,11 @@
 from __future__ import annotations
 import logging
+import time
+from collections import OrderedDict
 from homeassistant.config_entries import ConfigEntry
 
+from .metrics import METRICS
+
 _LOGGER = logging.getLogger(__name__)
 
 def _get_smbclient():
@@ -15,10 +19,19 @@ CONF_SMB_USER = "smb_user"
 CONF_SMB_PASS = "smb_pass"
 CONF_SMB_PATH = "smb_path"
 
+# How many folders keep a remembered listing for ETag/delta responses.
+# Older ones are dropped least-recently-browsed first and just get a full reply.
+LISTINGS_MAX = 32
+
 class SmbBrowser:
     def __init__(self, hass, entry: ConfigEntry):
         self.hass = hass
         self.entry = entry
+        # Seeded from the wall clock so listing versions (and the ETags built
+        # from them) keep increasing across restarts without being persisted.
+        self.version = int(time.time() * 1000)
+        # path -> {"version", "items", "prev_version", "prev_items"}, LRU order
+        self._listings: OrderedDict[str, dict] = OrderedDict()
 
     def _cfg(self):
         d = {**self.entry.data, **self.entry.options}
@@ -30,7 +43,49 @@ class SmbBrowser:
             d.get(CONF_SMB_PATH, "/") or "/",
         )
 
+    def _key(self, path: str | None) -> str:
+        """Folder a request for `path` actually lists (empty means the configured base)."""
+        return path or self._cfg()[4]
+
+    def listing(self, path: str | None) -> dict | None:
+        """Return the cached listing entry for `path` (see `listdir`)."""
+        return self._listings.get(self._key(path))
+
+    def changes_since(self, path: str | None, version: int) -> dict | None:
+        """Diff the cached listing of `path` against `version`, or None if we can't."""
+        entry = self._listings.get(self._key(path))
+        if entry is None:
+            return None
+        if version >= entry["version"]:
+            return {"added": [], "removed": []}
+        if entry["prev_items"] is None or version < entry["prev_version"]:
+            return None
+        old = {i["path"]: i for i in entry["prev_items"]}
+        new = {i["path"]: i for i in entry["items"]}
+        return {
+            "added": [i for p, i in new.items() if old.get(p) != i],
+            "removed": [p for p, i in old.items() if new.get(p) != i],
+        }
+
     async def listdir(self, path: str | None = None):
+        with METRICS.timer("smb.listdir"):
+            items = await self._listdir(path)
+        key = self._key(path)
+        entry = self._listings.get(key)
+        if entry is None or entry["items"] != items:
+            self.version += 1
+            self._listings[key] = {
+                "version": self.version,
+                "items": items,
+                "prev_version": entry["version"] if entry else None,
+                "prev_items": entry["items"] if entry else None,
+            }
+        self._listings.move_to_end(key)
+        while len(self._listings) > LISTINGS_MAX:
+            self._listings.popitem(last=False)
+        return items
+
+    async def _listdir(self, path: str | None = None):
         smbclient = await self.hass.async_add_executor_job(_get_smbclient)
         host, share, user, pwd, base = self._cfg()
         browse = path or base
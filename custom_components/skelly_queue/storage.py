@@ -1,46 +1,108 @@
 from __future__ import annotations
+import copy
+from collections import deque
+from collections.abc import Iterable
 from homeassistant.helpers.storage import Store
 
+from .metrics import METRICS
+
 STORE_KEY = "skelly_queue_store"
 STORE_VERSION = 2
 
+# How many queue mutations we remember for `since=<version>` delta responses.
+# Clients further behind than this just get the full queue again.
+CHANGELOG_MAX = 256
+
+# Longest play history kept for "no repeat within the last N plays".
+RECENT_MAX = 1000
+
 DEFAULT_STATE = {
     "queue": [],
     "last_played": None,
+    "version": 0,
+    "recent": [],
+    "play_counts": {},
 }
 
 class QueueStore:
     def __init__(self, hass):
         self.hass = hass
         self.store = Store(hass, STORE_VERSION, STORE_KEY)
-        self.data = DEFAULT_STATE.copy()
+        self.data = copy.deepcopy(DEFAULT_STATE)
+        self._changes: deque[dict] = deque(maxlen=CHANGELOG_MAX)
 
     async def async_load(self):
         stored = await self.store.async_load()
         if stored:
-            merged = DEFAULT_STATE.copy()
+            merged = copy.deepcopy(DEFAULT_STATE)
             merged.update(stored)
             self.data = merged
 
     async def async_save(self):
-        await self.store.async_save(self.data)
+        with METRICS.timer("store.save"):
+            await self.store.async_save(self.data)
+
+    @property
+    def version(self) -> int:
+        """Monotonic queue version; persisted so it keeps growing across restarts."""
+        return self.data["version"]
+
+    def _bump(self, op: str, **fields):
+        self.data["version"] += 1
+        self._changes.append({"version": self.data["version"], "op": op, **fields})
+
+    def changes_since(self, version: int) -> list[dict] | None:
+        """Return queue changes made after `version`, or None if they're no longer known."""
+        if version == self.version:
+            return []
+        if version > self.version or not self._changes or self._changes[0]["version"] > version + 1:
+            return None
+        return [c for c in self._changes if c["version"] > version]
 
     def get_queue(self):
         return list(self.data["queue"])
 
     async def add(self, item: dict):
         self.data["queue"].append(item)
+        self._bump("add", item=item)
         await self.async_save()
 
+    async def add_many(self, items: Iterable[dict]) -> int:
+        """Append items from any iterable with a single save; returns how many."""
+        n = 0
+        for item in items:
+            self.data["queue"].append(item)
+            self._bump("add", item=item)
+            n += 1
+        if n:
+            await self.async_save()
+        return n
+
     async def remove_at(self, idx: int):
         if 0 <= idx < len(self.data["queue"]):
             del self.data["queue"][idx]
+            self._bump("remove_at", index=idx)
             await self.async_save()
 
     async def clear(self):
         self.data["queue"].clear()
+        self._bump("clear")
         await self.async_save()
 
+    def recent(self, n: int) -> list[str]:
+        """Filenames of the last `n` plays, oldest first."""
+        return self.data["recent"][-n:] if n > 0 else []
+
+    def play_counts(self) -> dict[str, int]:
+        return self.data["play_counts"]
+
     async def set_last_played(self, item):
         self.data["last_played"] = item
+        name = (item or {}).get("filename")
+        if name:
+            counts = self.data["play_counts"]
+            counts[name] = counts.get(name, 0) + 1
+            recent = self.data["recent"]
+            recent.append(name)
+            del recent[:-RECENT_MAX]
         await self.async_save()